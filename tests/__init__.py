@@ -13,12 +13,12 @@ import xml.etree.ElementTree as ET
 DATA_DIR = Path(__file__).parent / "data"
 
 
-def get_schema(x_size, y_size, c_size=3, compressor=tiledb.ZstdFilter(level=0)):
+def get_schema(x_size, y_size, c_size=3, compressor=tiledb.ZstdFilter(level=1)):
     dims = []
     x_tile = min(x_size, 1024)
     y_tile = min(y_size, 1024)
     # WEBP Compressor does not accept specific dtypes so for dimensions we use the default
-    dim_compressor = tiledb.ZstdFilter(level=0)
+    dim_compressor = tiledb.ZstdFilter(level=1)
     if not isinstance(compressor, tiledb.WebpFilter):
         dim_compressor = compressor
     if isinstance(compressor, tiledb.WebpFilter):
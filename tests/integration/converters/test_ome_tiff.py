@@ -299,6 +299,25 @@ def test_ome_tiff_converter_different_compressors(
                 assert isinstance(A.schema.attr(0).filters[0], type(single_compressor))
 
 
+def test_ome_tiff_converter_callable_compressor(tmp_path):
+    input_path = str(get_path("CMU-1-Small-Region.ome.tiff"))
+    output_path = str(tmp_path)
+
+    def compressor_factory(level, level_shape):
+        # compress the rarely-read base level harder than the hot overview
+        assert len(level_shape) > 0
+        return tiledb.ZstdFilter(level=9 if level == 0 else 1)
+
+    OMETiffConverter.to_tiledb(input_path, output_path, compressor=compressor_factory)
+    assert len(tiledb.Group(str(tmp_path))) == 2
+    with open_bioimg(str(tmp_path / "l_0.tdb")) as A:
+        assert isinstance(A.schema.attr(0).filters[0], tiledb.ZstdFilter)
+        assert A.schema.attr(0).filters[0].level == 9
+    with open_bioimg(str(tmp_path / "l_1.tdb")) as A:
+        assert isinstance(A.schema.attr(0).filters[0], tiledb.ZstdFilter)
+        assert A.schema.attr(0).filters[0].level == 1
+
+
 @pytest.mark.parametrize(
     "filename", ["CMU-1-Small-Region.ome.tiff", "CMU-1-Small-Region-rgb.ome.tiff"]
 )
@@ -3,7 +3,7 @@ import os
 import pytest
 
 from tests import get_path
-from tiledb.bioimg import Converters, from_bioimg, to_bioimg
+from tiledb.bioimg import Converters, from_bioimg, from_bioimg_many, to_bioimg
 from tiledb.bioimg.converters.ome_tiff import OMETiffConverter
 from tiledb.bioimg.converters.ome_zarr import OMEZarrConverter
 from tiledb.bioimg.converters.openslide import OpenSlideConverter
@@ -38,3 +38,23 @@ def test_from_bioimg_wrapper(tmp_path, converter, file_path):
         rfromtype = from_bioimg(input_path, output_path, converter=converter)
         rtotype = to_bioimg(output_path, output_path_round, converter=converter)
         assert rfromtype == rtotype == OMEZarrConverter
+
+
+def test_from_bioimg_many_wrapper(tmp_path):
+    srcs = [
+        str(get_path("CMU-1-Small-Region.ome.tiff")),
+        str(get_path("rand_uint16.ome.tiff")),
+    ]
+    dests = [str(tmp_path / "a"), str(tmp_path / "b")]
+    results = from_bioimg_many(srcs, dests, converter=Converters.OMETIFF, max_workers=2)
+    assert list(results) == [OMETiffConverter, OMETiffConverter]
+    # every destination must round-trip like a single-file ingestion
+    for i, dest in enumerate(dests):
+        output_round = str(tmp_path / f"roundtrip_{i}.ome.tiff")
+        assert (
+            to_bioimg(dest, output_round, converter=Converters.OMETIFF)
+            == OMETiffConverter
+        )
+
+    with pytest.raises(ValueError):
+        from_bioimg_many(srcs, dests[:1], converter=Converters.OMETIFF)
@@ -38,3 +38,84 @@ class TestTileDBOpenSlide:
         with pytest.raises(KeyError) as e_info:
             _ = TileDBOpenSlide(group_path, attr="test_attr_name")
             assert "No attribute matching 'test_attr_name'" in str(e_info.value)
+
+    def test_level_array_handle_reuse(self, tmp_path):
+        schema = get_schema(64, 64)
+        group_path = str(tmp_path)
+        tiledb.Group.create(group_path)
+        with tiledb.Group(group_path, "w") as G:
+            level_path = str(tmp_path / "l_0.tdb")
+            tiledb.Array.create(level_path, schema)
+            with open_bioimg(level_path, "w") as A:
+                A.meta["level"] = 0
+            G.add(level_path)
+
+        with TileDBOpenSlide(group_path) as t:
+            level = t._levels[0]
+            # the level array is opened lazily...
+            assert level._array is None
+            t.read_level(0)
+            handle = level._array
+            assert handle is not None
+            # ...and the handle is reused across reads instead of reopening
+            t.read_level(0)
+            assert level._array is handle
+
+    def test_equality_and_hash(self, tmp_path):
+        schema = get_schema(64, 64)
+        group_path = str(tmp_path)
+        tiledb.Group.create(group_path)
+        with tiledb.Group(group_path, "w") as G:
+            level_path = str(tmp_path / "l_0.tdb")
+            tiledb.Array.create(level_path, schema)
+            with open_bioimg(level_path, "w") as A:
+                A.meta["level"] = 0
+            G.add(level_path)
+
+        with TileDBOpenSlide(group_path) as t:
+            # comparing against a foreign type must not raise, so that slides
+            # are usable in containment checks and as set/dict keys
+            assert t != "not a slide"
+            assert len({t, t}) == 1
+
+    def test_numeric_level_order(self, tmp_path):
+        # 12 levels so that a lexicographic ordering bug (l_10 < l_2) would
+        # surface; levels must sort by their parsed integer
+        level_dimensions = [
+            (4096 - 128 * level, 2048 - 64 * level) for level in range(12)
+        ]
+        schemas = [get_schema(*dims) for dims in level_dimensions]
+        group_path = str(tmp_path)
+        tiledb.Group.create(group_path)
+        with tiledb.Group(group_path, "w") as G:
+            for level, schema in enumerate(schemas):
+                level_path = str(tmp_path / f"l_{level}.tdb")
+                tiledb.Array.create(level_path, schema)
+                with open_bioimg(level_path, "w") as A:
+                    A.meta["level"] = level
+                G.add(level_path)
+
+        with TileDBOpenSlide(group_path) as t:
+            assert t.levels == tuple(range(12))
+            assert t.level_dimensions == tuple(level_dimensions)
+
+    def test_level_downsamples(self, tmp_path):
+        level_dimensions = [(4096 // 2**level, 2048 // 2**level) for level in range(4)]
+        schemas = [get_schema(*dims) for dims in level_dimensions]
+        group_path = str(tmp_path)
+        tiledb.Group.create(group_path)
+        with tiledb.Group(group_path, "w") as G:
+            for level, schema in enumerate(schemas):
+                level_path = str(tmp_path / f"l_{level}.tdb")
+                tiledb.Array.create(level_path, schema)
+                with open_bioimg(level_path, "w") as A:
+                    A.meta["level"] = level
+                G.add(level_path)
+
+        with TileDBOpenSlide(group_path) as t:
+            assert t.level_downsamples == (1.0, 2.0, 4.0, 8.0)
+            # the best level is the last one downsampled strictly below the factor
+            assert t.get_best_level_for_downsample(1.0) == 0
+            assert t.get_best_level_for_downsample(3.0) == 1
+            assert t.get_best_level_for_downsample(4.0) == 1
+            assert t.get_best_level_for_downsample(100.0) == 3
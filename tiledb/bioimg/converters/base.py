@@ -3,9 +3,16 @@ from __future__ import annotations
 import json
 import logging
 import os
+import queue
 import threading
 import warnings
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from operator import itemgetter
 from typing import (
     Any,
@@ -17,6 +24,7 @@ from typing import (
     Optional,
     Protocol,
     Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -58,7 +66,7 @@ from ..helpers import (
 from ..openslide import TileDBOpenSlide
 from ..version import version as PKG_VERSION
 from . import DATASET_TYPE, DEFAULT_SCRATCH_SPACE, FMT_VERSION
-from .axes import Axes
+from .axes import Axes, AxesMapper
 from .tiles import iter_tiles, num_tiles
 
 # Define covariant type variables
@@ -349,13 +357,28 @@ class ImageConverterMixin(Generic[TReader, TWriter]):
                     for levels>0, even though the converted images look visually identical to the
                     original ones.
                 :param max_workers: Maximum number of threads that can be used for conversion.
-                    Applicable only if chunked=True.
+                    Applicable only if chunked=True. Clamped to 4 for local filesystem
+                    destinations, where more writers only contend (a warning is emitted);
+                    for remote destinations a value of 0 selects a default based on the
+                    machine's core count.
                 :param exclude_metadata: If true, drop original metadata of the images and exclude them from being ingested.
                 :param experimental_reader: If true, use the experimental tiff reader optimized for s3 reads.
                     Experimental feature, use with caution
                 :param experimental_queue_limit: When using the experimental reader, define the minimum and maximum number of
                     pending tiles waiting to be written to TileDB.
-                :param compressor: TileDB compression filter mapping for each level
+                :param compressor: TileDB compression filter mapping for each level.
+                    Besides a single filter or a level-to-filter mapping, a callable
+                    (level, level_shape) -> Filter may be given to choose a filter per
+                    level, e.g. a high Zstd level for the archival base level and a
+                    fast one for the frequently read low-resolution levels.
+                    Defaults to ZstdFilter(level=1), favoring ingestion speed: compared
+                    to higher Zstd levels it compresses each tile several times faster
+                    for only a few percent more bytes on disk. Prefer level 1-3 for
+                    ingest-once/read-many datasets and level 9+ for archival storage.
+                    Single non-Webp compressors are automatically preceded by a
+                    BitShuffleFilter for floating point attributes or a ByteShuffleFilter
+                    for multi-byte integer attributes; pass an explicit filter sequence
+                    to override the pairing.
                 :param log: verbose logging, defaults to None. Allows passing custom logging.Logger or boolean.
                     If None or bool=False it initiates an INFO level logging. If bool=True then a logger is instantiated in
                     DEBUG logging level.
@@ -400,6 +423,25 @@ class ImageConverterMixin(Generic[TReader, TWriter]):
             source, logger, **reader_kwargs if reader_kwargs else {}
         )
 
+        # Differentiate parallelism by destination I/O: local filesystem writes
+        # stop scaling beyond a few threads (DRAM bandwidth and writer lock
+        # contention), while remote object stores hide latency with many more
+        _, out_scheme = resolve_path(output_path)
+        if is_local_path(out_scheme):
+            if max_workers > _LOCAL_FS_MAX_WORKERS:
+                warnings.warn(
+                    f"Clamping max_workers from {max_workers} to "
+                    f"{_LOCAL_FS_MAX_WORKERS} for a local filesystem destination"
+                )
+                max_workers = _LOCAL_FS_MAX_WORKERS
+        elif chunked and not max_workers:
+            # max_workers only drives the chunked tile pipeline; leave the
+            # non-chunked whole-image path serial as documented
+            max_workers = min(32, (os.cpu_count() or 1) * 5)
+            logger.info(
+                f"Defaulting max_workers to {max_workers} for a remote destination"
+            )
+
         max_tiles = cls._DEFAULT_TILES.copy()
         logger.debug(f"Max tiles:{max_tiles}")
         if tiles:
@@ -453,7 +495,7 @@ class ImageConverterMixin(Generic[TReader, TWriter]):
             compressors = {}
             for level in range(level_min, reader.level_count):
                 if compressor is None:
-                    compressors[level] = tiledb.ZstdFilter(level=0)
+                    compressors[level] = tiledb.ZstdFilter(level=1)
                 elif isinstance(compressor, tiledb.Filter):
                     if (
                         isinstance(compressor, tiledb.WebpFilter)
@@ -469,6 +511,23 @@ class ImageConverterMixin(Generic[TReader, TWriter]):
                 elif isinstance(compressor, Mapping):
                     compressors = compressor  # type: ignore
                     break
+                elif isinstance(compressor, Sequence) and not isinstance(
+                    compressor, str
+                ):
+                    # an explicit filter pipeline applies as-is to every level,
+                    # overriding the automatic shuffle pairing (see get_schema)
+                    compressors[level] = list(compressor)
+                elif callable(compressor):
+                    # factory resolving a filter per (level, level_shape), e.g.
+                    # heavier Zstd on the rarely-read base level and fast
+                    # levels on the hot low-resolution ones
+                    compressors[level] = compressor(level, reader.level_shape(level))
+                else:
+                    raise TypeError(
+                        f"Invalid compressor of type {type(compressor)}: expected a "
+                        "tiledb.Filter, a sequence of Filters, a level-to-Filter "
+                        "mapping or a (level, level_shape) -> Filter callable"
+                    )
 
             logger.debug(f"Compressors : {compressors}")
             convert_kwargs = dict(
@@ -569,6 +628,25 @@ class ImageConverterMixin(Generic[TReader, TWriter]):
         return cls
 
 
+# Number of threads prefetching source tiles ahead of the CPU-bound writers;
+# local filesystem reads stop scaling beyond a couple of concurrent readers
+_TILE_IO_WORKERS = 2
+
+# Worker-thread cap for local filesystem destinations
+_LOCAL_FS_MAX_WORKERS = 4
+
+
+def _map_array_contiguous(axes_mapper: AxesMapper, image: np.ndarray) -> np.ndarray:
+    """
+    Remap `image` axes and materialize the result in C order with a single copy.
+
+    The axes mappers return strided views wherever possible; materializing them
+    here with one fused copy hands TileDB a contiguous buffer, instead of
+    letting its writer gather the tile element-wise a second time.
+    """
+    return np.ascontiguousarray(axes_mapper.map_array(image))
+
+
 def _convert_level_to_tiledb(
     level: int,
     *,
@@ -605,7 +683,7 @@ def _convert_level_to_tiledb(
         dim_shape,
         max_tiles,
         attr_dtype,
-        compressor.get(level, tiledb.ZstdFilter(level=0)),
+        compressor.get(level, tiledb.ZstdFilter(level=1)),
     )
 
     # We need to calculate the min-max values per channel
@@ -636,7 +714,7 @@ def _convert_level_to_tiledb(
         "storedAxes": dim_names,
         "storedShape": dim_shape,
         "axesMapping": get_axes_translation(
-            compressor.get(level, tiledb.ZstdFilter(level=0)), reader.axes.dims
+            compressor.get(level, tiledb.ZstdFilter(level=1)), reader.axes.dims
         ),
     }
 
@@ -648,9 +726,11 @@ def _convert_level_to_tiledb(
         with open_bioimg(uri, "w", ctx=reader.dest_ctx) as out_array:
             out_array.meta.update(reader.level_metadata(level), level=level)
             inv_axes_mapper = axes_mapper.inverse
+            # walking the domain to enumerate and count tiles is per-level
+            # invariant, so compute it once instead of per loop setup
+            domain = out_array.domain
             if chunked:
                 ex = ThreadPoolExecutor(max_workers) if max_workers else None
-                mapper = getattr(ex, "map", map)
                 opt_reader = reader.optimal_reader(level=level, max_workers=max_workers)
 
                 if experimental_reader and opt_reader is not None:
@@ -660,7 +740,7 @@ def _convert_level_to_tiledb(
                     ) -> Tuple[np.ndarray, ...]:
                         idx, data = tile
                         array_tile = axes_mapper.map_tile(idx)
-                        out_array[array_tile] = axes_mapper.map_array(data)
+                        out_array[array_tile] = _map_array_contiguous(axes_mapper, data)
 
                         # return a tuple containing the min-max values of the tile
                         return np.amin(data, axis=min_max_indices), np.amax(
@@ -694,49 +774,173 @@ def _convert_level_to_tiledb(
                 else:
 
                     def tile_to_tiledb(
-                        level_tile: Tuple[slice, ...]
+                        level_tile: Tuple[slice, ...],
+                        axes_mapper: AxesMapper = axes_mapper,
+                        inv_axes_mapper: AxesMapper = inv_axes_mapper,
                     ) -> Tuple[np.ndarray, ...]:
+                        # the mappers are bound as default args: local lookups
+                        # are faster than closure cell reads in this hot loop
                         source_tile = inv_axes_mapper.map_tile(level_tile)
                         image = reader.level_image(level, source_tile)
-                        out_array[level_tile] = axes_mapper.map_array(image)
+                        out_array[level_tile] = _map_array_contiguous(
+                            axes_mapper, image
+                        )
 
                         # return a tuple containing the min-max values of the tile
                         return np.amin(image, axis=min_max_indices), np.amax(
                             image, axis=min_max_indices
                         )
 
-                    for tile_min, tile_max in tqdm(
-                        mapper(tile_to_tiledb, iter_tiles(out_array.domain)),
-                        desc=f"Ingesting level {level}",
-                        total=num_tiles(out_array.domain),
-                        unit="tiles",
-                    ):
-                        # Find the global min-max values from all tiles
-                        compute_channel_minmax(channel_min_max, tile_min, tile_max)
-                        pass
                     if ex:
-                        ex.shutdown()
+                        # Pipeline the ingestion: a small I/O pool prefetches
+                        # source tiles into a bounded queue while the CPU pool
+                        # remaps and writes them, overlapping tile decoding
+                        # with compression and fragment writes. The queue bound
+                        # keeps a constant number of decoded tiles in memory.
+                        level_tiles = iter_tiles(domain)
+                        tile_queue: queue.Queue[Any] = queue.Queue(
+                            maxsize=2 * (os.cpu_count() or 1)
+                        )
+                        tiles_lock = threading.Lock()
+                        minmax_lock = threading.Lock()
+                        # set on the first writer failure so prefetchers stop
+                        # producing and nobody blocks on the bounded queue;
+                        # the writer exception is re-raised from its future
+                        failed = threading.Event()
+                        progress = tqdm(
+                            desc=f"Ingesting level {level}",
+                            total=num_tiles(domain),
+                            unit="tiles",
+                        )
+
+                        def put_while_alive(item: Any) -> None:
+                            while not failed.is_set():
+                                try:
+                                    tile_queue.put(item, timeout=0.1)
+                                    return
+                                except queue.Full:
+                                    continue
+
+                        def prefetch_tiles() -> None:
+                            try:
+                                while not failed.is_set():
+                                    with tiles_lock:
+                                        level_tile = next(level_tiles, None)
+                                    if level_tile is None:
+                                        break
+                                    source_tile = inv_axes_mapper.map_tile(level_tile)
+                                    image = reader.level_image(level, source_tile)
+                                    put_while_alive((level_tile, image))
+                            except BaseException:
+                                # without this the writers would keep polling
+                                # the queue forever while the main thread is
+                                # blocked shutting the pool down
+                                failed.set()
+                                raise
+
+                        def write_tiles() -> None:
+                            try:
+                                while not failed.is_set():
+                                    try:
+                                        item = tile_queue.get(timeout=0.1)
+                                    except queue.Empty:
+                                        continue
+                                    if item is None:
+                                        break
+                                    level_tile, image = item
+                                    out_array[level_tile] = _map_array_contiguous(
+                                        axes_mapper, image
+                                    )
+                                    tile_min = np.amin(image, axis=min_max_indices)
+                                    tile_max = np.amax(image, axis=min_max_indices)
+                                    with minmax_lock:
+                                        compute_channel_minmax(
+                                            channel_min_max, tile_min, tile_max
+                                        )
+                                    progress.update()
+                            except BaseException:
+                                failed.set()
+                                raise
+
+                        try:
+                            with ThreadPoolExecutor(_TILE_IO_WORKERS) as io_ex:
+                                readers = [
+                                    io_ex.submit(prefetch_tiles)
+                                    for _ in range(_TILE_IO_WORKERS)
+                                ]
+                                writers = [
+                                    ex.submit(write_tiles) for _ in range(max_workers)
+                                ]
+                                for f in readers:
+                                    f.result()
+                                for _ in writers:
+                                    put_while_alive(None)
+                                for f in writers:
+                                    f.result()
+                        finally:
+                            progress.close()
+                            ex.shutdown()
+                    else:
+                        for tile_min, tile_max in tqdm(
+                            map(tile_to_tiledb, iter_tiles(domain)),
+                            desc=f"Ingesting level {level}",
+                            total=num_tiles(domain),
+                            unit="tiles",
+                        ):
+                            # Find the global min-max values from all tiles
+                            compute_channel_minmax(channel_min_max, tile_min, tile_max)
             else:
                 image = reader.level_image(level)
                 ex = ThreadPoolExecutor(max_workers) if max_workers else None
-                mapper = getattr(ex, "map", map)
 
-                def write_to_tiledb(level_tile: Tuple[slice, ...]) -> None:
+                def write_to_tiledb(
+                    level_tile: Tuple[slice, ...],
+                    axes_mapper: AxesMapper = axes_mapper,
+                    inv_axes_mapper: AxesMapper = inv_axes_mapper,
+                ) -> None:
                     source_tile = inv_axes_mapper.map_tile(level_tile)
-                    out_array[level_tile] = axes_mapper.map_array(image[source_tile])
+                    out_array[level_tile] = _map_array_contiguous(
+                        axes_mapper, image[source_tile]
+                    )
 
-                for _ in tqdm(
-                    mapper(
-                        write_to_tiledb, iter_tiles(out_array.domain, scale=tile_scale)
-                    ),
-                    desc=f"Ingesting level {level}",
-                    total=num_tiles(out_array.domain, scale=tile_scale),
-                    unit="tiles",
-                ):
-                    # Find the global min-max values from all tiles
-                    pass
+                total_tiles = num_tiles(domain, scale=tile_scale)
                 if ex:
+                    # Keep a bounded window of in-flight tiles and drive the
+                    # progress bar by completion order: progress no longer
+                    # stalls behind the slowest tile of a submission batch and
+                    # a failing tile raises instead of ending the iteration
+                    # silently.
+                    progress = tqdm(
+                        desc=f"Ingesting level {level}",
+                        total=total_tiles,
+                        unit="tiles",
+                    )
+                    in_flight: Set[Future[None]] = set()
+                    for level_tile in iter_tiles(domain, scale=tile_scale):
+                        in_flight.add(ex.submit(write_to_tiledb, level_tile))
+                        if len(in_flight) >= 2 * max_workers:
+                            done, in_flight = wait(
+                                in_flight, return_when=FIRST_COMPLETED
+                            )
+                            for f in done:
+                                f.result()
+                                progress.update()
+                    for f in as_completed(in_flight):
+                        f.result()
+                        progress.update()
+                    progress.close()
                     ex.shutdown()
+                else:
+                    for _ in tqdm(
+                        map(
+                            write_to_tiledb,
+                            iter_tiles(domain, scale=tile_scale),
+                        ),
+                        desc=f"Ingesting level {level}",
+                        total=total_tiles,
+                        unit="tiles",
+                    ):
+                        pass
 
                 compute_channel_minmax(
                     channel_min_max,
@@ -764,6 +968,37 @@ def _create_image_pyramid(
 
     levels_metadata: MutableMapping[str, Any] = {"axes": []}
 
+    try:
+        _generate_pyramid_levels(
+            reader,
+            rw_group,
+            base_uri,
+            base_level,
+            max_tiles,
+            compressors,
+            preserve_axes,
+            scaler,
+            levels_metadata,
+        )
+    finally:
+        # the base-tile cache (and the scaler workers holding their own
+        # copies of it) must not outlive the conversion that populated it
+        scaler.close()
+
+    return scaler.compressors, levels_metadata
+
+
+def _generate_pyramid_levels(
+    reader: ImageReader,
+    rw_group: ReadWriteGroup,
+    base_uri: str,
+    base_level: int,
+    max_tiles: MutableMapping[str, int],
+    compressors: Mapping[int, tiledb.Filter],
+    preserve_axes: bool,
+    scaler: Scaler,
+    levels_metadata: MutableMapping[str, Any],
+) -> None:
     for i, dim_shape in enumerate(scaler.level_shapes):
         level = base_level + 1 + i
 
@@ -805,5 +1040,3 @@ def _create_image_pyramid(
         # is the base image layer else we use the previously generated layer
         if scaler.progressive:
             base_uri = uri
-
-    return scaler.compressors, levels_metadata
@@ -3,6 +3,7 @@ from __future__ import annotations
 import decimal
 import logging
 import math
+import os
 import warnings
 from typing import (
     Any,
@@ -50,6 +51,9 @@ class OMETiffReader:
 
     _logger: logging.Logger
 
+    # Levels larger than this are decoded into a scratch memmap instead of RAM
+    _MEMMAP_THRESHOLD_BYTES = 1 << 30
+
     def __init__(
         self,
         input_path: str,
@@ -85,6 +89,7 @@ class OMETiffReader:
         self._series = self._tiff.series[0]
         omexml = self._tiff.ome_metadata
         self._metadata = tifffile.xml2dict(omexml) if omexml else {}
+        self._write_kwargs_cache: Dict[Tuple[int, bool], str] = {}
 
     def __enter__(self) -> OMETiffReader:
         return self
@@ -157,11 +162,14 @@ class OMETiffReader:
         self._logger.debug(f"Level {level} shape: {l_shape}")
         return l_shape
 
-    def level_image(
-        self, level: int, tile: Optional[Tuple[slice, ...]] = None
-    ) -> np.ndarray:
-        if tile is None:
-            return self._series.levels[level].asarray()
+    def level_zarr(self, level: int) -> Any:
+        """
+        Return the image for the given level as a zarr array.
+
+        The zarr store maps straight onto the TIFF's own tile grid, so
+        block-wise consumers decode only the chunks they touch instead of
+        materializing the whole level in memory.
+        """
         try:
             import zarr
         except ImportError:
@@ -169,7 +177,19 @@ class OMETiffReader:
         if not hasattr(self, "_zarr_group"):
             store = self._series.aszarr(multiscales=True)
             self._zarr_group = zarr.open(store, mode="r")
-        return np.asarray(self._zarr_group[level][tile])
+        return self._zarr_group[level]
+
+    def level_image(
+        self, level: int, tile: Optional[Tuple[slice, ...]] = None
+    ) -> np.ndarray:
+        if tile is None:
+            tiff_level = self._series.levels[level]
+            # Decode with all cores; for levels too big to comfortably hold in
+            # RAM spill the decoded pixels to a scratch memmap so peak RSS is
+            # bounded by the OS page cache instead of the full level size
+            out = "memmap" if tiff_level.nbytes > self._MEMMAP_THRESHOLD_BYTES else None
+            return tiff_level.asarray(out=out, maxworkers=os.cpu_count())
+        return np.asarray(self.level_zarr(level)[tile])
 
     def level_metadata(self, level: int) -> Dict[str, Any]:
         if level == 0:
@@ -179,6 +199,13 @@ class OMETiffReader:
         self._logger.debug(f"Level {level} - Metadata: {metadata}")
         keyframe = self._series.levels[level].keyframe
         self._logger.debug(f"Level {level} -Keyframe: {keyframe}")
+        # serializing the keyframe kwargs is reflection-heavy and can encode
+        # megabytes of color/JPEG tables, so reuse it for levels that share
+        # their keyframe structure
+        cache_key = (id(keyframe), level == 0)
+        cached = self._write_kwargs_cache.get(cache_key)
+        if cached is not None:
+            return {"json_write_kwargs": cached}
         extratags = []
         get_tag = keyframe.tags.get
         self._logger.debug(f"Level {level} - Tag: {keyframe}")
@@ -208,7 +235,9 @@ class OMETiffReader:
             resolution=keyframe.resolution,
             resolutionunit=keyframe.resolutionunit,
         )
-        return {"json_write_kwargs": json.dumps(write_kwargs)}
+        json_write_kwargs = json.dumps(write_kwargs)
+        self._write_kwargs_cache[cache_key] = json_write_kwargs
+        return {"json_write_kwargs": json_write_kwargs}
 
     @property
     def group_metadata(self) -> Dict[str, Any]:
@@ -1,6 +1,9 @@
+import threading
+from collections import OrderedDict
 from concurrent import futures
 from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
 import skimage as sk
 
 import tiledb
@@ -9,6 +12,69 @@ from .axes import AxesMapper
 from .tiles import iter_tiles
 
 
+class _BaseTileCache:
+    """
+    Process-local LRU cache of decoded base-level tiles, bounded by total bytes.
+
+    When the pyramid is generated non-progressively, every downsampled level
+    re-reads the same base level, so each base tile would be fetched and
+    decompressed once per output level. Caching the decoded tiles makes each
+    one a single read across all levels; with a progressive pyramid the input
+    array changes per level and older entries simply age out.
+
+    The bound is expressed in bytes rather than entries: in the non-chunked
+    path an "entry" is a whole level (tens of gigabytes for a large slide), so
+    a count bound alone is a latent out-of-memory. Entries larger than the
+    budget are never stored. The hit/miss counters allow tuning the budget.
+
+    Keys include the caller-supplied fragment state of the array, so entries
+    cannot outlive a rewrite of the same URI; the cache must additionally be
+    `clear`ed when the conversion that populated it finishes (see
+    `Scaler.close`) so the decoded pixels are not pinned for the process
+    lifetime.
+    """
+
+    def __init__(self, max_bytes: int = 2**31):
+        self._max_bytes = max_bytes
+        self._nbytes = 0
+        self._tiles: "OrderedDict[Tuple[Any, ...], np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tiles.clear()
+            self._nbytes = 0
+
+    def read(
+        self,
+        array: tiledb.Array,
+        tile: Tuple[slice, ...],
+        fragment_state: Tuple[str, ...] = (),
+    ) -> np.ndarray:
+        key = (array.uri, fragment_state, tuple((s.start, s.stop) for s in tile))
+        with self._lock:
+            image = self._tiles.get(key)
+            if image is not None:
+                self._tiles.move_to_end(key)
+                self.hits += 1
+                return image
+        image = array[tile]
+        with self._lock:
+            self.misses += 1
+            if key not in self._tiles and image.nbytes <= self._max_bytes:
+                self._tiles[key] = image
+                self._nbytes += image.nbytes
+                while self._nbytes > self._max_bytes:
+                    _, evicted = self._tiles.popitem(last=False)
+                    self._nbytes -= evicted.nbytes
+        return image
+
+
+_base_tile_cache = _BaseTileCache()
+
+
 class Scaler(object):
     def __init__(
         self,
@@ -73,6 +139,13 @@ class Scaler(object):
     def update_compressors(self, level: int, lvl_filter: tiledb.Filter) -> None:
         self._scale_compressors[level] = lvl_filter
 
+    def close(self) -> None:
+        """Release conversion-scoped resources: the decoded base-tile cache
+        and the worker processes, each of which holds its own copy of it."""
+        _base_tile_cache.clear()
+        if self._executor:
+            self._executor.shutdown()
+
     def apply(
         self,
         in_array: tiledb.Array,
@@ -80,11 +153,16 @@ class Scaler(object):
         level: int,
         axes_mapper: AxesMapper,
     ) -> None:
+        # The fragment uris enumerate the input array's write history, so a
+        # rewritten array at the same URI cannot hit tiles cached from the
+        # previous contents
+        fragment_state = tuple(f.uri for f in tiledb.array_fragments(in_array.uri))
         scale_kwargs = dict(
             in_array=in_array,
             out_array=out_array,
             axes_mapper=axes_mapper,
             scale_factors=self._scale_factors[level] if self._scale_factors else None,
+            fragment_state=fragment_state,
             **self._resize_kwargs,
         )
 
@@ -107,13 +185,18 @@ def _scale(
     axes_mapper: AxesMapper,
     tile: Optional[Tuple[slice, ...]] = None,
     scale_factors: Sequence[float] = (),
+    fragment_state: Tuple[str, ...] = (),
     **resize_kwargs: Any,
 ) -> None:
     if tile is None:
         tile = axes_mapper.inverse.map_tile(
             tuple(slice(0, size) for size in out_array.shape)
         )
-        image = in_array[:]
+        image = _base_tile_cache.read(
+            in_array,
+            tuple(slice(0, size) for size in in_array.shape),
+            fragment_state,
+        )
     else:
         tile = axes_mapper.inverse.map_tile(tile)
 
@@ -130,7 +213,9 @@ def _scale(
             start = int(tile_slice.start * scale_factor)
             stop = int(min(tile_slice.stop * scale_factor, dim_size))
             scaled_tile.append(slice(start, stop))
-        image = in_array[tuple(axes_mapper.map_tile(tuple(scaled_tile)))]
+        image = _base_tile_cache.read(
+            in_array, tuple(axes_mapper.map_tile(tuple(scaled_tile))), fragment_state
+        )
 
     tile_shape = tuple(s.stop - s.start for s in tile)
     tile = axes_mapper.map_tile(tile)
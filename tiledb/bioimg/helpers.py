@@ -4,7 +4,10 @@ import logging
 import os
 import re
 import sys
+import warnings
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import (
     Any,
@@ -13,6 +16,7 @@ from typing import (
     List,
     Mapping,
     MutableMapping,
+    MutableSequence,
     Optional,
     Sequence,
     Tuple,
@@ -64,6 +68,9 @@ class ReadWriteGroup:
         self.m_group = tiledb.Group(self._uri, "m", ctx=self._ctx)
         if self._group_exists:
             self._valid_group = self.r_group.meta.get("valid", False)
+        # One listing of the group members replaces a membership round-trip
+        # per level in get_or_create, which adds up on remote storage
+        self._member_names = {o.name for o in self.r_group if o.name}
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -73,7 +80,9 @@ class ReadWriteGroup:
 
     def get_or_create(self, name: str, schema: tiledb.ArraySchema) -> Tuple[str, bool]:
         create = False
-        if name in self.r_group:
+        # check against the members listed at open; fall back to the group for
+        # members added since (e.g. by a concurrent writer)
+        if name in self._member_names or name in self.r_group:
             uri = self.r_group[name].uri
         else:
             uri = os.path.join(self._uri, name).replace("\\", "/")
@@ -105,6 +114,7 @@ class ReadWriteGroup:
                 self.w_group.add(uri, name, relative=False)
             else:
                 self.w_group.add(name, name, relative=True)
+            self._member_names.add(name)
         return uri, create
 
     @property
@@ -149,6 +159,9 @@ def open_bioimg(
     config: Config = None,
     ctx: Optional[Ctx] = None,
 ) -> tiledb.Array:
+    # Read-mode arrays are opened on a single attribute: slicing then yields
+    # that attribute's ndarray directly and TileDB core skips deserializing
+    # any other attribute, instead of materializing an attribute dict
     return tiledb.open(
         uri, mode=mode, attr=attr if mode == "r" else None, config=config, ctx=ctx
     )
@@ -159,31 +172,85 @@ def get_schema(
     dim_shape: Tuple[int, ...],
     max_tiles: Mapping[str, int],
     attr_dtype: np.dtype,
-    compressor: tiledb.Filter,
+    compressor: Union[tiledb.Filter, Sequence[tiledb.Filter]],
 ) -> tiledb.ArraySchema:
-    # find the smallest dtype that can hold `np.prod(dim_shape)` values
-    dim_dtype = np.min_scalar_type(np.prod(dim_shape))
+    # find the smallest dtype that can hold the number of cells in the domain;
+    # the product is accumulated as a Python int, which cannot silently
+    # overflow like np.prod's fixed-width accumulator, so np.uint32 dimensions
+    # are picked whenever the domain fits
+    num_cells = 1
+    for dim_size in dim_shape:
+        num_cells *= int(dim_size)
+    dim_dtype = np.min_scalar_type(num_cells)
+
+    # A single filter or a filter pipeline may be given (e.g. a ByteShuffleFilter
+    # followed by a ZstdFilter); the last filter is the compressor proper
+    attr_filters = (
+        [compressor] if isinstance(compressor, tiledb.Filter) else list(compressor)
+    )
+    if len(attr_filters) == 1 and not isinstance(attr_filters[0], tiledb.WebpFilter):
+        # Shuffling multi-byte samples before compression increases local
+        # redundancy and boosts the compression ratio losslessly: bit-shuffle
+        # wins on floating point data, byte-shuffle on wide integer samples
+        if np.issubdtype(attr_dtype, np.floating):
+            attr_filters.insert(0, tiledb.BitShuffleFilter())
+        elif np.dtype(attr_dtype).itemsize > 1:
+            attr_filters.insert(0, tiledb.ByteShuffleFilter())
 
     dims = []
     assert len(dim_names) == len(dim_shape), (dim_names, dim_shape)
     # WEBP Compressor does not accept specific dtypes so for dimensions we use the default
-    dim_compressor = tiledb.ZstdFilter(level=0)
-    if not isinstance(compressor, tiledb.WebpFilter):
-        dim_compressor = compressor
-    for dim_name, dim_size in zip(dim_names, dim_shape):
-        dim_tile = min(dim_size, max_tiles[dim_name])
+    dim_filters = [tiledb.ZstdFilter(level=1)]
+    if not isinstance(attr_filters[-1], tiledb.WebpFilter):
+        dim_filters = [attr_filters[-1]]
+    dim_tiles = [
+        min(dim_size, max_tiles[dim_name])
+        for dim_name, dim_size in zip(dim_names, dim_shape)
+    ]
+    if isinstance(attr_filters[-1], tiledb.ZstdFilter):
+        _avoid_zstd_tier_edge(
+            dim_names, dim_shape, dim_tiles, np.dtype(attr_dtype).itemsize
+        )
+    for dim_name, dim_size, dim_tile in zip(dim_names, dim_shape, dim_tiles):
         dim = tiledb.Dim(
             dim_name,
             (0, dim_size - 1),
             dim_tile,
             dtype=dim_dtype,
-            filters=[dim_compressor],
+            filters=dim_filters,
         )
         dims.append(dim)
-    attr = tiledb.Attr(name=ATTR_NAME, dtype=attr_dtype, filters=[compressor])
+    attr = tiledb.Attr(name=ATTR_NAME, dtype=attr_dtype, filters=attr_filters)
     return tiledb.ArraySchema(domain=tiledb.Domain(*dims), attrs=[attr])
 
 
+# Zstd picks weaker compression parameters for inputs of at most 256 KiB, so tiles
+# landing exactly on that boundary compress at roughly half the throughput
+_ZSTD_TIER_EDGE_BYTES = 256 * 1024
+
+
+def _avoid_zstd_tier_edge(
+    dim_names: Tuple[str, ...],
+    dim_shape: Tuple[int, ...],
+    dim_tiles: MutableSequence[int],
+    itemsize: int,
+) -> None:
+    """
+    Nudge tile extents off Zstd's 256 KiB parameter-tier boundary in place.
+
+    Rounding one spatial extent up by a single cell pushes the tile over the
+    boundary into the faster parameter tier at no storage cost.
+    """
+    tile_bytes = int(np.prod(dim_tiles)) * itemsize
+    if _ZSTD_TIER_EDGE_BYTES - itemsize <= tile_bytes <= _ZSTD_TIER_EDGE_BYTES:
+        for dim_name in "Y", "X":
+            if dim_name in dim_names:
+                idx = dim_names.index(dim_name)
+                if dim_tiles[idx] < dim_shape[idx]:
+                    dim_tiles[idx] += 1
+                    return
+
+
 def get_axes_mapper(
     source_axes: Axes,
     source_shape: Tuple[int, ...],
@@ -193,7 +260,7 @@ def get_axes_mapper(
     max_tiles: Mapping[str, int],
 ) -> Tuple[AxesMapper, Tuple[str, ...], MutableMapping[str, int]]:
     tiles = dict(max_tiles)
-    pixel_depth = get_pixel_depth(compressor.get(level, tiledb.ZstdFilter(level=0)))
+    pixel_depth = get_pixel_depth(compressor.get(level, tiledb.ZstdFilter(level=1)))
     if pixel_depth == 1:
         if preserve_axes:
             target_axes = source_axes
@@ -202,6 +269,11 @@ def get_axes_mapper(
         axes_mapper = source_axes.mapper(target_axes)
         dim_names = tuple(target_axes.dims)
     else:
+        if preserve_axes:
+            warnings.warn(
+                "preserve_axes is ignored with a Webp compressor: the channel "
+                "axis is interleaved into X and the image is stored as YX"
+            )
         tiles["X"] *= pixel_depth
         axes_mapper = source_axes.webp_mapper(pixel_depth)
         dim_names = ("Y", "X")
@@ -212,18 +284,38 @@ def get_axes_mapper(
 def iter_levels_meta(
     group: tiledb.Group, config: Config = None, ctx: Optional[Ctx] = None
 ) -> Iterator[Mapping[str, Any]]:
-    for o in group:
-        with open_bioimg(o.uri, config=config, ctx=ctx) as array:
-            try:
-                level = array.meta["level"]
-            except KeyError as exc:
-                raise RuntimeError(
-                    "Key: 'level' not found in array metadata. Make sure that levels have been "
-                    "ingested correctly in any previous process for the same image."
-                ) from exc
-            domain = array.schema.domain
-            axes = "".join(domain.dim(dim_idx).name for dim_idx in range(domain.ndim))
-            yield dict(level=level, name=f"l_{level}.tdb", axes=axes, shape=array.shape)
+    # Enumerate the members once, then fetch their schemas concurrently: on
+    # object stores each schema load is a round-trip, so pipelining them makes
+    # this metadata pass cost roughly one round-trip instead of one per level
+    uris = [o.uri for o in group]
+
+    def load_level_meta(uri: str) -> Mapping[str, Any]:
+        # The member name encodes the level, so loading just the schema is
+        # enough; it skips the fragment metadata work that dominates a full
+        # array open. Members not following the l_<level>.tdb naming fall
+        # back to opening the array and reading the level from its metadata.
+        match = re.search(r"l_(\d+)\.tdb/*$", uri)
+        if match:
+            level = int(match.group(1))
+            domain = tiledb.ArraySchema.load(uri, ctx=ctx).domain
+        else:
+            with open_bioimg(uri, config=config, ctx=ctx) as array:
+                try:
+                    level = array.meta["level"]
+                except KeyError as exc:
+                    raise RuntimeError(
+                        "Key: 'level' not found in array metadata. Make sure that levels have been "
+                        "ingested correctly in any previous process for the same image."
+                    ) from exc
+                domain = array.schema.domain
+        axes = "".join(domain.dim(dim_idx).name for dim_idx in range(domain.ndim))
+        return dict(level=level, name=f"l_{level}.tdb", axes=axes, shape=domain.shape)
+
+    if len(uris) > 1:
+        with ThreadPoolExecutor(min(len(uris), 16)) as pool:
+            yield from pool.map(load_level_meta, uris)
+    else:
+        yield from map(load_level_meta, uris)
 
 
 def iter_pixel_depths_meta(
@@ -375,12 +467,17 @@ def get_logger(level: int = logging.INFO, name: str = __name__) -> logging.Logge
     return logger
 
 
+@lru_cache(maxsize=2)
 def get_logger_wrapper(
     verbose: bool = False,
 ) -> logging.Logger:
     """
     Get a logger instance and log version information.
 
+    The result is cached per verbosity: the underlying logger is a singleton
+    anyway, so repeated calls (e.g. one per file in a batch ingestion) would
+    only rebuild the handler/formatter and re-log the version line.
+
     :param verbose: verbose logging, defaults to False
     :return: logger instance
     """
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import re
+import threading
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from operator import attrgetter
-from typing import Any, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -18,11 +22,68 @@ from tiledb import Config, Ctx
 from tiledb.highlevel import _get_ctx
 
 from . import ATTR_NAME
-from .converters.axes import Axes
+from .converters.axes import Axes, AxesMapper
 from .helpers import open_bioimg
 
+# level array member names as written by the converters (l_<level>.tdb)
+_LEVEL_URI_RE = re.compile(r"l_(\d+)\.tdb/*$")
+
+# decoded tiles kept per level so that overlapping region reads (deep-zoom
+# viewers, patch samplers) reuse decompressed pixels instead of re-fetching
+_TILE_CACHE_MAX_BYTES = 2**28
+
+
+class _TileLRUCache:
+    """LRU cache of decoded tiles, bounded by total bytes.
+
+    The bound is expressed in bytes rather than entries: a tile's size is set
+    by the schema's extents and pixel depth, so a count bound alone can pin
+    gigabytes of pixels per level. Tiles larger than the budget are never
+    stored.
+    """
+
+    __slots__ = ("_max_bytes", "_nbytes", "_tiles", "_lock")
+
+    def __init__(self, max_bytes: int = _TILE_CACHE_MAX_BYTES):
+        self._max_bytes = max_bytes
+        self._nbytes = 0
+        self._tiles: "OrderedDict[Tuple[Any, ...], np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[np.ndarray]:
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._tiles.move_to_end(key)
+            return tile
+
+    def put(self, key: Tuple[Any, ...], tile: np.ndarray) -> None:
+        with self._lock:
+            if key not in self._tiles and tile.nbytes <= self._max_bytes:
+                self._tiles[key] = tile
+                self._nbytes += tile.nbytes
+                while self._nbytes > self._max_bytes:
+                    _, evicted = self._tiles.popitem(last=False)
+                    self._nbytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tiles.clear()
+            self._nbytes = 0
+
 
 class TileDBOpenSlide:
+    # patch-sampling pipelines hold thousands of open slides at once, so keep
+    # instances on slots rather than a per-instance __dict__
+    __slots__ = (
+        "_ctx",
+        "_cfg",
+        "_group",
+        "_levels",
+        "_downsamples",
+        "_level_dimensions",
+    )
+
     @classmethod
     def from_group_uri(cls, uri: str, attr: str = ATTR_NAME) -> TileDBOpenSlide:
         warnings.warn(
@@ -49,20 +110,41 @@ class TileDBOpenSlide:
         self._group = tiledb.Group(uri, ctx=self._ctx)
         pixel_depth = self._group.meta.get("pixel_depth", "")
         pixel_depth = dict(json.loads(pixel_depth)) if pixel_depth else {}
-        self._levels = sorted(
-            (
-                TileDBOpenSlideLevel(
-                    o.uri, pixel_depth, attr=attr, config=config, ctx=ctx
-                )
-                for o in self._group
-            ),
-            key=attrgetter("level"),
-        )
+        levels = [
+            TileDBOpenSlideLevel(o.uri, pixel_depth, attr=attr, config=config, ctx=ctx)
+            for o in self._group
+        ]
+        # Level ordering is parsed from the member names; legacy groups that
+        # predate the l_<level>.tdb naming must open every array to read its
+        # metadata, so resolve those concurrently rather than one by one
+        if len(levels) > 1 and not all(
+            _LEVEL_URI_RE.search(level._uri) for level in levels
+        ):
+            with ThreadPoolExecutor(min(len(levels), 16)) as pool:
+                list(pool.map(attrgetter("level"), levels))
+        self._levels = sorted(levels, key=attrgetter("level"))
+        if self._levels:
+            # Validate the attribute from the schema, which is much cheaper
+            # than opening the array and keeps the level opens lazy
+            schema = tiledb.ArraySchema.load(self._levels[0]._uri, ctx=self._ctx)
+            if not schema.has_attr(attr):
+                raise KeyError(f"No attribute matching {attr!r}")
+        self._downsamples: Optional[np.ndarray] = None
+        self._level_dimensions: Optional[Tuple[Tuple[int, int], ...]] = None
 
     def __enter__(self) -> TileDBOpenSlide:
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all opened level arrays and the underlying group.
+
+        Level arrays are opened lazily and their handles are reused across
+        read_region/read_level calls, so a long-lived slide should be closed
+        explicitly (or used as a context manager) when done.
+        """
         for level in self._levels:
             level.close()
         self._group.close()
@@ -95,7 +177,25 @@ class TileDBOpenSlide:
 
         :return: A sequence of dimensions for each level
         """
-        return tuple(map(attrgetter("dimensions"), self._levels))
+        # snapshotted on first use: viewers query this per navigation event
+        # and each level access crosses into the TileDB C layer for the shape
+        if self._level_dimensions is None:
+            self._level_dimensions = tuple(map(attrgetter("dimensions"), self._levels))
+        return self._level_dimensions
+
+    @property
+    def _downsamples_array(self) -> np.ndarray:
+        # computed on first use (so the level arrays stay unopened until then)
+        # and cached: viewers query the downsamples once per displayed frame
+        if self._downsamples is None:
+            level_dims = self.level_dimensions
+            l0_w, l0_h = level_dims[0]
+            self._downsamples = np.fromiter(
+                ((l0_w / w + l0_h / h) / 2.0 for w, h in level_dims),
+                dtype=np.float64,
+                count=len(level_dims),
+            )
+        return self._downsamples
 
     @property
     def level_downsamples(self) -> Sequence[float]:
@@ -103,9 +203,7 @@ class TileDBOpenSlide:
         A sequence of downsample factors for each level of the slide.
         level_downsamples[k] is the downsample factor of level k.
         """
-        level_dims = self.level_dimensions
-        l0_w, l0_h = level_dims[0]
-        return tuple((l0_w / w + l0_h / h) / 2.0 for w, h in level_dims)
+        return tuple(self._downsamples_array.tolist())
 
     @property
     def properties(self) -> Mapping[str, Any]:
@@ -159,8 +257,10 @@ class TileDBOpenSlide:
 
         :return: The number corresponding to a level
         """
-        lla = np.where(np.array(self.level_downsamples) < factor)[0]
-        return int(lla.max() if len(lla) > 0 else 0)
+        # pyramid downsamples increase monotonically with the level, so the
+        # last level below `factor` is found with a binary search
+        lla = int(np.searchsorted(self._downsamples_array, factor, side="left")) - 1
+        return max(lla, 0)
 
     def _read_image(
         self,
@@ -174,6 +274,25 @@ class TileDBOpenSlide:
 
 
 class TileDBOpenSlideLevel:
+    # every open slide carries one instance per pyramid level and everything
+    # beyond (uri, attr, config, ctx) is a lazily filled cache, so the
+    # attribute set is fixed and kept on slots
+    __slots__ = (
+        "_uri",
+        "_attr",
+        "_config",
+        "_ctx",
+        "_array",
+        "_level",
+        "_dims",
+        "_dimensions",
+        "_tiles",
+        "_pixel_depths",
+        "_depth",
+        "_tile_cache",
+        "_inv_mappers",
+    )
+
     def __init__(
         self,
         uri: str,
@@ -183,20 +302,81 @@ class TileDBOpenSlideLevel:
         config: Config = None,
         ctx: Optional[Ctx] = None,
     ):
-        self._tdb = open_bioimg(uri, attr=attr, config=config, ctx=ctx)
-        self._pixel_depth = pixel_depth.get(str(self.level), 1)
+        self._uri = uri
+        self._attr = attr
+        self._config = config
+        self._ctx = ctx
+        self._array: Optional[tiledb.Array] = None
+        self._level: Optional[int] = None
+        self._dims: Optional[Tuple[str, ...]] = None
+        self._dimensions: Optional[Tuple[int, int]] = None
+        self._tiles: Optional[Mapping[str, int]] = None
+        self._pixel_depths = pixel_depth
+        self._depth: Optional[int] = None
+        # each level keeps its own byte-bounded LRU of decoded tiles; keys are
+        # the aligned (x_start, y_start) tile corners, so region reads that
+        # overlap on a tile share its single decompression
+        self._tile_cache = _TileLRUCache()
+        # inverse axes mappers keyed on the requested axes canonical dims;
+        # rebuilding the composite mapper on every read_region call is pure
+        # Python dispatch overhead in patch-extraction loops
+        self._inv_mappers: Dict[str, AxesMapper] = {}
+
+    @property
+    def _pixel_depth(self) -> int:
+        if self._depth is None:
+            self._depth = self._pixel_depths.get(str(self.level), 1)
+        return self._depth
+
+    @property
+    def _tdb(self) -> tiledb.Array:
+        # The array is opened lazily on first access: a slide may hold many
+        # levels but most consumers touch the pixels of only one or two
+        if self._array is None:
+            self._array = open_bioimg(
+                self._uri, attr=self._attr, config=self._config, ctx=self._ctx
+            )
+        return self._array
 
     @property
     def level(self) -> int:
-        return int(self._tdb.meta["level"])
+        if self._level is None:
+            # The member name encodes the level (l_<level>.tdb), sparing an
+            # array open round-trip per level; fall back to the array metadata
+            # for groups that predate this naming scheme
+            match = _LEVEL_URI_RE.search(self._uri)
+            if match:
+                self._level = int(match.group(1))
+            else:
+                self._level = int(self._tdb.meta["level"])
+        return self._level
+
+    @property
+    def _dim_names(self) -> Tuple[str, ...]:
+        # walking the domain for dimension names costs a string build per
+        # call; compute the layout once per level and reuse it on every read
+        if self._dims is None:
+            self._dims = tuple(dim.name for dim in self._tdb.domain)
+        return self._dims
+
+    @property
+    def tiles(self) -> Mapping[str, int]:
+        """Tile (chunk) extent of each dimension of this level."""
+        if self._tiles is None:
+            self._tiles = {dim.name: int(dim.tile) for dim in self._tdb.domain}
+        return self._tiles
 
     @property
     def dimensions(self) -> Tuple[int, int]:
-        a = self._tdb
-        dims = list(a.domain)
-        width = a.shape[dims.index(a.dim("X"))]
-        height = a.shape[dims.index(a.dim("Y"))]
-        return width // self._pixel_depth, height
+        # the shape is rebuilt by the C layer on every access; snapshot it
+        # once as a tuple of plain ints
+        if self._dimensions is None:
+            a = self._tdb
+            dims = self._dim_names
+            width = int(a.shape[dims.index("X")])
+            height = int(a.shape[dims.index("Y")])
+            self._dimensions = (width // self._pixel_depth, height)
+        return self._dimensions
 
     @property
     def properties(self) -> Mapping[str, Any]:
@@ -208,19 +388,156 @@ class TileDBOpenSlideLevel:
         dim_slice: MutableMapping[str, slice] = {},
         to_dask: bool = False,
     ) -> Union[np.ndarray, da.Array]:
-        dims = tuple(dim.name for dim in self._tdb.domain)
+        dims = self._dim_names
         pixel_depth = self._pixel_depth
-        if pixel_depth == 1:
-            axes_mapper = axes.mapper(Axes(dims))
-        else:
+        if pixel_depth != 1:
             x = dim_slice.get("X")
             if x is not None:
                 dim_slice["X"] = slice(x.start * pixel_depth, x.stop * pixel_depth)
-            axes_mapper = axes.webp_mapper(pixel_depth)
+        inv_axes_mapper = self._inverse_mapper(axes)
 
+        crop: MutableMapping[str, slice] = {}
+        if dim_slice and not to_dask:
+            dim_slice, crop = self._align_slices(dim_slice)
         array = da.from_tiledb(self._tdb) if to_dask else self._tdb
-        selector = tuple(dim_slice.get(dim, slice(None)) for dim in dims)
-        return axes_mapper.inverse.map_array(array[selector])
+        if crop and "X" in dim_slice and "Y" in dim_slice:
+            raw = self._read_aligned_region(dim_slice, crop)
+            crop = {}
+        else:
+            selector = tuple(dim_slice.get(dim, slice(None)) for dim in dims)
+            raw = array[selector]
+        if crop:
+            raw = raw[tuple(crop.get(dim, slice(None)) for dim in dims)]
+        image = inv_axes_mapper.map_array(raw)
+        if to_dask:
+            return image
+        # Remapping returns a strided view on transposing layouts; materialize
+        # it here with a single fused copy so consumers (e.g. PNG/JPEG
+        # encoders) get a C-contiguous array and skip their own gather copy
+        return np.ascontiguousarray(image)
+
+    def _inverse_mapper(self, axes: Axes) -> AxesMapper:
+        inv = self._inv_mappers.get(axes.dims)
+        if inv is None:
+            pixel_depth = self._pixel_depth
+            if pixel_depth == 1:
+                mapper = axes.mapper(Axes(self._dim_names))
+            else:
+                mapper = axes.webp_mapper(pixel_depth)
+            inv = self._inv_mappers[axes.dims] = mapper.inverse
+        return inv
+
+    def _read_aligned_region(
+        self, dim_slice: Mapping[str, slice], crop: Mapping[str, slice]
+    ) -> np.ndarray:
+        """Assemble a requested region by blitting individually cached tiles.
+
+        The X and Y slices must already be aligned to the tile extents (see
+        `_align_slices`), so each tile read maps to one `_tile_cache` entry.
+        The output buffer is preallocated with the size of the *requested*
+        (cropped) region and only the requested pixels of each tile are
+        copied into it: each output pixel is written exactly once, instead of
+        materializing the full aligned rectangle and cropping it afterwards.
+        """
+        dims = self._dim_names
+        shape = self._tdb.shape
+        tiles = self.tiles
+        x_axis, y_axis = dims.index("X"), dims.index("Y")
+        x, y = dim_slice["X"], dim_slice["Y"]
+        # clamp the requested stops to the level bounds, like plain ndarray
+        # slicing would: a region overhanging the edge shrinks to the overlap
+        req_x = slice(
+            x.start + crop["X"].start, min(x.start + crop["X"].stop, shape[x_axis])
+        )
+        req_y = slice(
+            y.start + crop["Y"].start, min(y.start + crop["Y"].stop, shape[y_axis])
+        )
+        # non-spatial dimensions are read with their exact requested bounds
+        extra_bounds = tuple(
+            (dim, s.start, s.stop)
+            for dim, s in dim_slice.items()
+            if dim not in ("X", "Y")
+        )
+        region_shape = list(shape)
+        for dim, start, stop in extra_bounds:
+            region_shape[dims.index(dim)] = stop - start
+        region_shape[x_axis] = max(req_x.stop - req_x.start, 0)
+        region_shape[y_axis] = max(req_y.stop - req_y.start, 0)
+        region = np.empty(region_shape, dtype=self._tdb.schema.attr(self._attr).dtype)
+        src = [slice(None)] * len(dims)
+        dest = [slice(None)] * len(dims)
+        for x_start in range(x.start, x.stop, tiles["X"]):
+            x_lo = max(x_start, req_x.start)
+            x_hi = min(x_start + tiles["X"], req_x.stop)
+            if x_lo >= x_hi:
+                continue
+            for y_start in range(y.start, y.stop, tiles["Y"]):
+                y_lo = max(y_start, req_y.start)
+                y_hi = min(y_start + tiles["Y"], req_y.stop)
+                if y_lo >= y_hi:
+                    continue
+                key = (x_start, y_start, extra_bounds)
+                tile = self._tile_cache.get(key)
+                if tile is None:
+                    tile = self._read_tile(x_start, y_start, extra_bounds)
+                    self._tile_cache.put(key, tile)
+                src[x_axis] = slice(x_lo - x_start, x_hi - x_start)
+                src[y_axis] = slice(y_lo - y_start, y_hi - y_start)
+                dest[x_axis] = slice(x_lo - req_x.start, x_hi - req_x.start)
+                dest[y_axis] = slice(y_lo - req_y.start, y_hi - req_y.start)
+                region[tuple(dest)] = tile[tuple(src)]
+        return region
+
+    def _read_tile(
+        self, x_start: int, y_start: int, extra: Tuple[Tuple[str, int, int], ...] = ()
+    ) -> np.ndarray:
+        """Read the single decoded tile whose top-left corner is (x_start, y_start).
+
+        `extra` carries the exact (dim, start, stop) bounds of any non-spatial
+        dimensions of the request; it is part of the cache key, so tiles
+        cached for one channel/time selection are not served for another.
+        """
+        dims = self._dim_names
+        shape = self._tdb.shape
+        tiles = self.tiles
+        bounds = {dim: (start, stop) for dim, start, stop in extra}
+        bounds["X"] = (x_start, min(x_start + tiles["X"], shape[dims.index("X")]))
+        bounds["Y"] = (y_start, min(y_start + tiles["Y"], shape[dims.index("Y")]))
+        selector = tuple(
+            slice(*bounds[dim]) if dim in bounds else slice(None) for dim in dims
+        )
+        return self._tdb[selector]
+
+    def _align_slices(
+        self, dim_slice: Mapping[str, slice]
+    ) -> Tuple[MutableMapping[str, slice], MutableMapping[str, slice]]:
+        """Round the given slices outwards to the tile extents of this level.
+
+        TileDB always fetches and decompresses whole tiles, so issuing the read
+        over the tile-aligned bounding rectangle costs no extra I/O and lets
+        overlapping region reads hit the same tiles. Returns the aligned slices
+        along with the slices that crop the read back to the requested region.
+        """
+        dims = self._dim_names
+        shape = self._tdb.shape
+        tiles = self.tiles
+        aligned: MutableMapping[str, slice] = {}
+        crop: MutableMapping[str, slice] = {}
+        for dim, s in dim_slice.items():
+            if dim not in ("X", "Y"):
+                # only the spatial dimensions are tile-aligned; the others
+                # keep their exact bounds and need no crop
+                aligned[dim] = s
+                continue
+            tile = tiles[dim]
+            start = s.start // tile * tile
+            stop = min(-(-s.stop // tile) * tile, shape[dims.index(dim)])
+            aligned[dim] = slice(start, stop)
+            crop[dim] = slice(s.start - start, s.stop - start)
+        return aligned, crop
 
     def close(self) -> None:
-        self._tdb.close()
+        self._tile_cache.clear()
+        if self._array is not None:
+            self._array.close()
+            self._array = None
@@ -1,8 +1,13 @@
 import importlib.metadata
-from typing import Any, Mapping, Type
+from typing import Any, Dict, Mapping, Type
 
 from .converters.base import ImageConverterMixin, ImageReader, ImageWriter
 
+# converter classes already resolved from their entry points; loading an entry
+# point imports its module (tifffile, zarr, openslide stacks), so each one is
+# imported at most once and only when actually requested
+_converter_cache: Dict[str, Type[ImageConverterMixin[Any, Any]]] = {}
+
 
 def _load_entrypoints(name: str) -> Mapping[str, Any]:
     eps = importlib.metadata.entry_points()[name]
@@ -19,3 +24,16 @@ def load_writers() -> Mapping[str, ImageWriter]:
 
 def load_converters() -> Mapping[str, Type[ImageConverterMixin[Any, Any]]]:
     return _load_entrypoints("bioimg.converters")
+
+
+def load_converter(name: str) -> Type[ImageConverterMixin[Any, Any]]:
+    """Load a single converter entry point, importing only its module."""
+    converter = _converter_cache.get(name)
+    if converter is None:
+        for ep in importlib.metadata.entry_points()["bioimg.converters"]:
+            if ep.name == name:
+                converter = _converter_cache[name] = ep.load()
+                break
+        else:
+            raise KeyError(f"No converter entry point named {name!r}")
+    return converter
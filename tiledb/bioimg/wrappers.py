@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import importlib.util
-from typing import Any, Optional
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional, Sequence
 
 try:
     importlib.util.find_spec("tifffile")
@@ -20,9 +23,18 @@ else:
 
 from . import _osd_exc
 from .helpers import get_logger_wrapper
-from .plugin_manager import load_converters
+from .plugin_manager import load_converter
 from .types import Converters
 
+# converter enum -> (import guard, entry point name, log label); both wrappers
+# dispatch through this table instead of duplicating an if/elif chain
+_CONVERTER_DISPATCH = {
+    Converters.OMETIFF: (_tiff_exc, "tiff_converter", "OME-TIFF file"),
+    Converters.OMEZARR: (_zarr_exc, "zarr_converter", "OME-Zarr file"),
+    Converters.OSD: (_osd_exc, "osd_converter", "Openslide"),
+    Converters.PNG: (None, "png_converter", "PNG"),
+}
+
 
 def from_bioimg(
     src: str,
@@ -55,61 +67,59 @@ def from_bioimg(
     reader_kwargs["dest_config"] = kwargs.pop(
         "dest_config", reader_kwargs["source_config"]
     )
-    converters = load_converters()
-    if converter is Converters.OMETIFF:
-        if not _tiff_exc:
-            logger.info("Converting OME-TIFF file")
-            return converters["tiff_converter"].to_tiledb(
-                source=src,
-                output_path=dest,
-                log=logger,
-                exclude_metadata=exclude_metadata,
-                tile_scale=tile_scale,
-                reader_kwargs=reader_kwargs,
-                **kwargs,
-            )
-        else:
-            raise _tiff_exc
-    elif converter is Converters.OMEZARR:
-        if not _zarr_exc:
-            logger.info("Converting OME-Zarr file")
-            return converters["zarr_converter"].to_tiledb(
-                source=src,
-                output_path=dest,
-                log=logger,
-                exclude_metadata=exclude_metadata,
-                tile_scale=tile_scale,
-                reader_kwargs=reader_kwargs,
-                **kwargs,
-            )
-        else:
-            raise _zarr_exc
-    elif converter is Converters.OSD:
-        if not _osd_exc:
-            logger.info("Converting Openslide")
-            return converters["osd_converter"].to_tiledb(
-                source=src,
-                output_path=dest,
-                log=logger,
-                exclude_metadata=exclude_metadata,
-                tile_scale=tile_scale,
-                reader_kwargs=reader_kwargs,
-                **kwargs,
-            )
-        else:
-            raise _osd_exc
-    else:
+    exc, entrypoint, label = _CONVERTER_DISPATCH[converter]
+    if exc:
+        raise exc
+    logger.info(f"Converting {label}")
+    return load_converter(entrypoint).to_tiledb(
+        source=src,
+        output_path=dest,
+        log=logger,
+        exclude_metadata=exclude_metadata,
+        tile_scale=tile_scale,
+        reader_kwargs=reader_kwargs,
+        **kwargs,
+    )
 
-        logger.info("Converting PNG")
-        return converters["png_converter"].to_tiledb(
-            source=src,
-            output_path=dest,
-            log=logger,
-            exclude_metadata=exclude_metadata,
-            tile_scale=tile_scale,
-            reader_kwargs=reader_kwargs,
-            **kwargs,
-        )
+
+def from_bioimg_many(
+    srcs: Sequence[str],
+    dests: Sequence[str],
+    converter: Converters = Converters.OMETIFF,
+    *,
+    max_workers: Optional[int] = None,
+    **kwargs: Any,
+) -> Sequence[Any]:
+    """
+    Ingest many files by fanning `from_bioimg` out across worker processes.
+
+    Per-file ingestion is dominated by tile codec work (libtiff, libopenslide)
+    that holds the GIL or is not thread-safe, so a bulk conversion job is
+    parallelized across processes rather than threads. Each worker holds one
+    file's working set (a batch of decoded tiles plus the TileDB write
+    buffers), so size `max_workers` to the available memory and not only to
+    the core count. Keyword arguments, including any `source_config`/
+    `dest_config`, are forwarded identically to every `from_bioimg` call.
+
+    :param srcs: source paths, one per file to be ingested
+    :param dests: destination TileDB paths, matching `srcs` one to one
+    :param converter: The converter type to be used for all files
+    :param max_workers: number of worker processes, defaults to os.cpu_count()
+    :param kwargs: keyword arguments forwarded to each `from_bioimg` call
+    :return: the per-file results in the order of `srcs`
+    """
+    if len(srcs) != len(dests):
+        raise ValueError("srcs and dests must have the same length")
+    # spawn the workers: importing this package creates a TileDB context, and
+    # forking a process that holds one deadlocks inside TileDB core
+    with ProcessPoolExecutor(
+        max_workers or os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        fs = [
+            executor.submit(from_bioimg, src, dest, converter, **kwargs)
+            for src, dest in zip(srcs, dests)
+        ]
+        return [f.result() for f in fs]
 
 
 def to_bioimg(
@@ -130,30 +140,15 @@ def to_bioimg(
     :param kwargs: keyword arguments for custom exportation behaviour
     :return: None
     """
-    converters = load_converters()
-    logger = get_logger_wrapper(verbose)
-    if converter is Converters.OMETIFF:
-        if not _tiff_exc:
-            logger.info("Converting to OME-TIFF file")
-            return converters["tiff_converter"].from_tiledb(
-                input_path=src, output_path=dest, log=logger, **kwargs
-            )
-        else:
-            raise _tiff_exc
-    elif converter is Converters.OMEZARR:
-        if not _zarr_exc:
-            logger.info("Converting to OME-Zarr file")
-            return converters["zarr_converter"].from_tiledb(
-                input_path=src, output_path=dest, log=logger, **kwargs
-            )
-        else:
-            raise _zarr_exc
-    elif converter is Converters.PNG:
-        logger.info("Converting to PNG file")
-        return converters["png_converter"].from_tiledb(
-            input_path=src, output_path=dest, log=logger, **kwargs
-        )
-    else:
+    if converter is Converters.OSD:
         raise NotImplementedError(
             "Openslide Converter does not support exportation back to bio-imaging formats"
         )
+    logger = get_logger_wrapper(verbose)
+    exc, entrypoint, label = _CONVERTER_DISPATCH[converter]
+    if exc:
+        raise exc
+    logger.info(f"Converting to {label}")
+    return load_converter(entrypoint).from_tiledb(
+        input_path=src, output_path=dest, log=logger, **kwargs
+    )